@@ -1,10 +1,11 @@
 import uvicorn
 
-from app.settings import settings
+from app.settings import get_settings
 
 
 def main() -> None:
     """Entrypoint of the application."""
+    settings = get_settings()
     uvicorn.run(
         "app.api.application:get_app",
         workers=settings.workers_count,
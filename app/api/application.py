@@ -2,13 +2,13 @@ from importlib import metadata
 from pathlib import Path
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, UJSONResponse
+from fastapi.responses import Response, UJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.api.lifespan import lifespan_setup
 from app.api.v1.router import api_router
-from app.core.exceptions.exceptions import AppError
+from app.core.exceptions.exceptions import AppError, build_error_responses
 from app.core.logging.log import configure_logging
 from app.core.middleware.logging_middleware import logging_middleware
 
@@ -34,8 +34,10 @@ def get_app() -> FastAPI:
         default_response_class=UJSONResponse,
     )
 
+    build_error_responses()
+
     @app.exception_handler(AppError)
-    async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
+    async def app_error_handler(request: Request, exc: AppError) -> Response:
         return exc.to_response()
 
     app.add_middleware(BaseHTTPMiddleware, dispatch=logging_middleware)
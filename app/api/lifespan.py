@@ -4,7 +4,7 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 
 from app.cache.factory import RedisFactory
-from app.settings import settings
+from app.settings import get_settings
 
 
 @asynccontextmanager
@@ -22,7 +22,7 @@ async def lifespan_setup(
     """
 
     app.middleware_stack = None
-    redis_factory = RedisFactory(str(settings.redis_url))
+    redis_factory = RedisFactory(get_settings().redis_url)
     app.state.redis_factory = redis_factory
     app.middleware_stack = app.build_middleware_stack()
 
@@ -4,9 +4,9 @@ import json
 from hashlib import blake2b
 from typing import Any, Dict, Optional
 
+import ujson
 from loguru import logger
 from redis.asyncio import Redis
-from redis.exceptions import RedisError
 
 
 def query_hash(query_params: Dict[str, Any], digest_size: int = 16) -> str:
@@ -55,11 +55,11 @@ async def get_cache(redis: Redis, key: str) -> Optional[Dict[str, Any]]:
             logger.debug(f"Cache miss: {key}")
             return None
 
-        data = json.loads(cached)
+        data = ujson.loads(cached)
         logger.debug(f"Cache hit: {key}")
         return data
 
-    except (RedisError, json.JSONDecodeError, UnicodeDecodeError, Exception) as e:
+    except Exception as e:
         logger.warning(
             f"Cache get failed for key '{key}': {e.__class__.__name__}: {e!s}",
         )
@@ -84,12 +84,12 @@ async def set_cache(
         True if cached successfully, False on error
     """
     try:
-        payload = json.dumps(data)
+        payload = ujson.dumps(data)
         await redis.setex(key, ttl, payload)
         logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
         return True
 
-    except (RedisError, TypeError, ValueError, Exception) as e:
+    except Exception as e:
         logger.warning(
             f"Cache set failed for key '{key}': {e.__class__.__name__}: {e!s}",
         )
@@ -1,11 +1,37 @@
 """Custom exceptions for the application."""
 
-from fastapi.responses import JSONResponse
+from typing import Dict, Tuple, Type
+
+import ujson
+from fastapi.responses import Response
 from starlette import status
 
 from app.core.constants import ErrorCodes, ErrorMessages
 
 
+def _render_error_body(
+    http_code: int,
+    error_code: str,
+    detail: str,
+    error_type: str,
+) -> bytes:
+    """Serialize the standard error envelope to JSON bytes."""
+    return ujson.dumps(
+        {
+            "success": False,
+            "data": {},
+            "meta": {},
+            "error": {
+                "code": http_code,
+                "error_code": error_code,
+                "message": detail,
+                "type": error_type,
+            },
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
 class AppError(Exception):
     """Base application exception."""
 
@@ -16,25 +42,54 @@ class AppError(Exception):
     def __init__(self, detail: str | None = None) -> None:
         self.detail = detail or self.message
 
-    def to_response(self) -> JSONResponse:
-        """Convert the error to a FastAPI JSONResponse.
+    def to_response(self) -> Response:
+        """Convert the error to a FastAPI JSON response.
+
+        Errors raised without a custom detail reuse the body pre-rendered
+        by ``build_error_responses``; only custom details are serialized.
 
         Returns:
-            JSONResponse: A formatted error response with status code and error details.
+            Response: A formatted error response with status code and error details.
         """
-        return JSONResponse(
-            status_code=self.http_code,
-            content={
-                "success": False,
-                "data": {},
-                "meta": {},
-                "error": {
-                    "code": self.http_code,
-                    "error_code": self.error_code,
-                    "message": self.detail,
-                    "type": self.__class__.__name__,
-                },
-            },
+        cached = _ERROR_RESPONSES.get(type(self))
+        if cached is not None and self.detail == self.message:
+            http_code, body = cached
+        else:
+            http_code = self.http_code
+            body = _render_error_body(
+                http_code,
+                self.error_code,
+                self.detail,
+                self.__class__.__name__,
+            )
+        return Response(
+            content=body,
+            status_code=http_code,
+            media_type="application/json",
+        )
+
+
+# Pre-rendered (status code, body) of every AppError raised without detail.
+_ERROR_RESPONSES: Dict[Type[AppError], Tuple[int, bytes]] = {}
+
+
+def build_error_responses() -> None:
+    """Pre-render the default error body of every ``AppError`` subclass.
+
+    Call once at startup, after all exception classes are imported.
+    """
+    pending = [AppError]
+    while pending:
+        error_cls = pending.pop()
+        pending.extend(error_cls.__subclasses__())
+        _ERROR_RESPONSES[error_cls] = (
+            error_cls.http_code,
+            _render_error_body(
+                error_cls.http_code,
+                error_cls.error_code,
+                error_cls.message,
+                error_cls.__name__,
+            ),
         )
 
 
@@ -1,10 +1,14 @@
+import atexit
 import logging
+import queue
 import sys
-from typing import Any, Union
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from pathlib import Path
+from typing import List, Union
 
 from loguru import logger
 
-from app.settings import settings
+from app.settings import get_settings
 
 # Create logs directory
 log_dir = "logs"
@@ -44,13 +48,64 @@ class InterceptHandler(logging.Handler):
         )
 
 
-def is_access_log(record: Any) -> bool:
-    """Filter for access logs."""
-    return record["message"] == "access"
+# Access log line; query string is rendered as-is and headers as raw
+# (name, value) byte pairs, so the middleware does not copy them per request.
+ACCESS_LOG_FORMAT = '%s - "%s %s?%s HTTP/1.1" %d - Headers: %s - Process Time: %.2fms'
+
+# Access logs bypass loguru: records are queued as-is and formatted and
+# written by a background listener thread.
+access_logger = logging.getLogger("app.access")
+_access_listeners: List[QueueListener] = []
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Enqueue the record untouched.
+
+        :param record: record to enqueue.
+        :return: the same record.
+        """
+        return record
+
+
+def stop_access_logging() -> None:
+    """Flush queued access logs and stop the listener thread."""
+    while _access_listeners:
+        _access_listeners.pop().stop()
+
+
+def configure_access_logging() -> None:  # pragma: no cover
+    """Route the access logger through a queue to a rotating file."""
+    stop_access_logging()
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+
+    file_handler = TimedRotatingFileHandler(
+        f"{log_dir}/access.log",
+        when="midnight",
+        backupCount=10,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    access_logger.handlers = [DeferredQueueHandler(log_queue)]
+    access_logger.setLevel(logging.INFO)
+    access_logger.propagate = False
+
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    _access_listeners.append(listener)
+
+
+atexit.register(stop_access_logging)
 
 
 def configure_logging() -> None:  # pragma: no cover
     """Configures logging."""
+    settings = get_settings()
     intercept_handler = InterceptHandler()
 
     logging.basicConfig(handlers=[intercept_handler], level=logging.NOTSET)
@@ -80,21 +135,7 @@ def configure_logging() -> None:  # pragma: no cover
         retention="10 days",
         filter=lambda r: r["extra"].get("event") == "interceptor",
     )
-    access_log_format = (
-        "{extra[client_ip]} - "
-        '"{extra[method]} {extra[path]}?{extra[query_params]} HTTP/1.1" '
-        "{extra[status_code]} - "
-        "Headers: {extra[headers]} - "
-        "Process Time: {extra[process_time]}"
-    )
-
-    logger.add(
-        f"{log_dir}/access.log",
-        filter=is_access_log,
-        rotation="1 day",
-        retention="10 days",
-        format=access_log_format,
-    )
+    configure_access_logging()
     if settings.debug:
         logger.add(
             f"{log_dir}/debug.log",
@@ -11,10 +11,8 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
     :param request: current request.
     :yield: database session.
     """
-    session: AsyncSession = request.app.state.db_factory.get_session()
-
-    try:
-        yield session
-    finally:
-        await session.commit()
-        await session.close()
+    async with request.app.state.db_factory.get_session() as session:
+        try:
+            yield session
+        finally:
+            await session.commit()
@@ -1,22 +1,210 @@
 """Database factory."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import atexit
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Tuple
+from uuid import uuid4
 
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
-class DatabaseFactory:
-    """Database factory."""
 
-    def __init__(self, db_url: str, db_echo: bool) -> None:
-        self.engine = create_async_engine(db_url, echo=db_echo)
+class _SharedEngine:
+    """An engine, its session factory and the number of factories using it."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
         self.session_factory = async_sessionmaker(
-            self.engine,
+            engine,
             expire_on_commit=False,
+            autoflush=False,
+        )
+        self.users = 0
+
+
+# Engines shared by every DatabaseFactory created with the same URL and
+# pool options, keyed by event loop too: asyncpg connections belong to the
+# loop that opened them. The registry holds the loop strongly, so every
+# engine is disposed explicitly: when the last factory using it closes, by
+# ``DatabaseFactory.dispose_all()``, or at interpreter exit.
+_ENGINE_CACHE: Dict[
+    Tuple[asyncio.AbstractEventLoop, Tuple[Any, ...]],
+    _SharedEngine,
+] = {}
+
+
+def _dispose_at_exit() -> None:
+    """Dispose engines left on event loops that can still run them."""
+    while _ENGINE_CACHE:
+        (loop, _), shared = _ENGINE_CACHE.popitem()
+        shared.users = 0
+        if not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(shared.engine.dispose())
+
+
+atexit.register(_dispose_at_exit)
+
+
+class DatabaseFactory:
+    """Database factory."""
+
+    def __init__(
+        self,
+        db_url: str,
+        db_echo: bool,
+        pool_pre_ping: bool = False,
+        pool_recycle: int = 1800,
+        pgbouncer: bool = False,
+        null_pool: bool = False,
+        jit: bool = True,
+    ) -> None:
+        """
+        Store the engine options.
+
+        The engine itself is created lazily, on first use in each event
+        loop, and shared with other factories built with the same options
+        until all of them are closed.
+
+        :param db_url: database URL.
+        :param db_echo: log all statements issued by the engine.
+        :param pool_pre_ping: issue a liveness check on every checkout.
+            Leave disabled behind PgBouncer/RDS Proxy, which already
+            handle liveness.
+        :param pool_recycle: recycle pooled connections older than this
+            many seconds.
+        :param pgbouncer: target PgBouncer in transaction mode
+            (disables asyncpg's and SQLAlchemy's prepared statement
+            caches and gives each statement a unique name).
+        :param null_pool: do not pool connections, for short-lived scripts.
+        :param jit: leave PostgreSQL JIT compilation enabled. Disabling it
+            is sent as a ``jit`` startup parameter, which PgBouncer rejects
+            unless it is listed in ``ignore_startup_parameters``; behind
+            PgBouncer, turn JIT off on the database or role instead.
+        """
+        self._db_url = db_url
+        self._key = (
+            db_url,
+            db_echo,
+            pool_pre_ping,
+            pool_recycle,
+            pgbouncer,
+            null_pool,
+            jit,
         )
+        connect_args: Dict[str, Any] = {}
+        self._engine_kwargs: Dict[str, Any] = {
+            "echo": db_echo,
+            "pool_pre_ping": pool_pre_ping,
+        }
+        if null_pool:
+            self._engine_kwargs["poolclass"] = NullPool
+        else:
+            self._engine_kwargs["pool_recycle"] = pool_recycle
+        if pgbouncer:
+            connect_args.update(
+                statement_cache_size=0,
+                prepared_statement_cache_size=0,
+                # Default ``__asyncpg_stmt_N__`` names collide across
+                # the backends PgBouncer hands out.
+                prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+            )
+        if not jit:
+            connect_args["server_settings"] = {"jit": "off"}
+        if connect_args:
+            self._engine_kwargs["connect_args"] = connect_args
+        self._shared: Dict[asyncio.AbstractEventLoop, _SharedEngine] = {}
+
+    def _shared_engine(self) -> _SharedEngine:
+        """Engine shared by this factory in the running event loop."""
+        loop = asyncio.get_running_loop()
+        shared = self._shared.get(loop)
+        # A count of zero means dispose_all() has disposed the engine.
+        if shared is None or shared.users == 0:
+            shared = _ENGINE_CACHE.get((loop, self._key))
+            if shared is None:
+                shared = _SharedEngine(
+                    create_async_engine(self._db_url, **self._engine_kwargs),
+                )
+                _ENGINE_CACHE[loop, self._key] = shared
+            shared.users += 1
+            self._shared[loop] = shared
+        return shared
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Engine for the running event loop."""
+        return self._shared_engine().engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Session factory for the running event loop."""
+        return self._shared_engine().session_factory
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Get session.
 
-    def get_session(self) -> AsyncSession:
-        """Get session."""
-        return self.session_factory()
+        The session is always closed on exit, returning its connection
+        to the pool.
+
+        :yield: database session.
+        """
+        session = self.session_factory()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    @asynccontextmanager
+    async def get_readonly_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Get session for read-only work.
+
+        Marks ``session.info["readonly"]`` so event listeners can skip
+        write-side bookkeeping.
+
+        :yield: database session.
+        """
+        async with self.get_session() as session:
+            session.info["readonly"] = True
+            yield session
 
     async def close(self) -> None:
-        """Close connection."""
-        await self.engine.dispose()
+        """
+        Close connection.
+
+        Releases this factory's engines. Each engine is disposed once the
+        last factory sharing it is closed; engines of other, finished
+        event loops are dropped without closing their connections, which
+        only those loops could do.
+        """
+        loop = asyncio.get_running_loop()
+        while self._shared:
+            engine_loop, shared = self._shared.popitem()
+            if shared.users == 0:
+                continue
+            shared.users -= 1
+            if shared.users == 0:
+                del _ENGINE_CACHE[engine_loop, self._key]
+                await shared.engine.dispose(close=engine_loop is loop)
+
+    @classmethod
+    async def dispose_all(cls) -> None:
+        """
+        Dispose the running event loop's engines and forget them.
+
+        Disposes engines regardless of how many factories still use them;
+        those factories create a new engine on their next session.
+        """
+        loop = asyncio.get_running_loop()
+        for key in [key for key in _ENGINE_CACHE if key[0] is loop]:
+            shared = _ENGINE_CACHE.pop(key)
+            shared.users = 0
+            await shared.engine.dispose()
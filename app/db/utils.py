@@ -1,44 +1,59 @@
 from sqlalchemy import text
-from sqlalchemy.engine import make_url
-from sqlalchemy.ext.asyncio import create_async_engine
-
-from app.settings import settings
-
-
-async def create_database() -> None:
-    """Create a database."""
-    db_url = make_url(str(settings.db_url.with_path("/postgres")))
-    engine = create_async_engine(db_url, isolation_level="AUTOCOMMIT")
-
-    async with engine.connect() as conn:
-        database_existance = await conn.execute(
-            text(
-                f"SELECT 1 FROM pg_database WHERE datname='{settings.db_base}'",  # noqa: S608
-            ),
-        )
-        database_exists = database_existance.scalar() == 1
-
-    if database_exists:
-        await drop_database()
-
-    async with engine.connect() as conn:
-        await conn.execute(
-            text(
-                f'CREATE DATABASE "{settings.db_base}" ENCODING "utf8" TEMPLATE template1',  # noqa: E501
-            ),
-        )
-
-
-async def drop_database() -> None:
-    """Drop current database."""
-    db_url = make_url(str(settings.db_url.with_path("/postgres")))
-    engine = create_async_engine(db_url, isolation_level="AUTOCOMMIT")
-    async with engine.connect() as conn:
-        disc_users = (
-            "SELECT pg_terminate_backend(pg_stat_activity.pid) "  # noqa: S608
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from app.settings import get_settings
+
+
+def _maintenance_engine() -> AsyncEngine:
+    """Engine bound to the ``postgres`` maintenance database."""
+    return create_async_engine(
+        get_settings().db_url("postgres"),
+        isolation_level="AUTOCOMMIT",
+    )
+
+
+async def _drop_database(conn: AsyncConnection, db_name: str) -> None:
+    """Terminate connections to a database and drop it if it exists."""
+    await conn.execute(
+        text(
+            "SELECT pg_terminate_backend(pg_stat_activity.pid) "
             "FROM pg_stat_activity "
-            f"WHERE pg_stat_activity.datname = '{settings.db_base}' "
-            "AND pid <> pg_backend_pid();"
-        )
-        await conn.execute(text(disc_users))
-        await conn.execute(text(f'DROP DATABASE "{settings.db_base}"'))
+            "WHERE pg_stat_activity.datname = :db_name "
+            "AND pid <> pg_backend_pid()",
+        ),
+        {"db_name": db_name},
+    )
+    db_ident = conn.dialect.identifier_preparer.quote_identifier(db_name)
+    await conn.execute(text(f"DROP DATABASE IF EXISTS {db_ident}"))
+
+
+async def create_database(db_name: str) -> None:
+    """
+    Create a database, dropping any existing one with the same name.
+
+    :param db_name: name of the database to create.
+    """
+    engine = _maintenance_engine()
+    try:
+        async with engine.connect() as conn:
+            await _drop_database(conn, db_name)
+            db_ident = conn.dialect.identifier_preparer.quote_identifier(db_name)
+            await conn.execute(
+                text(f"CREATE DATABASE {db_ident} ENCODING 'utf8' TEMPLATE template1"),
+            )
+    finally:
+        await engine.dispose()
+
+
+async def drop_database(db_name: str) -> None:
+    """
+    Drop a database.
+
+    :param db_name: name of the database to drop.
+    """
+    engine = _maintenance_engine()
+    try:
+        async with engine.connect() as conn:
+            await _drop_database(conn, db_name)
+    finally:
+        await engine.dispose()
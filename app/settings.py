@@ -1,14 +1,45 @@
 import enum
+from functools import cached_property, lru_cache
 from pathlib import Path
 from tempfile import gettempdir
-from typing import Optional
+from typing import Any, Optional
+from urllib.parse import quote
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from yarl import URL
 
 TEMP_DIR = Path(gettempdir())
 
 
+def _url_host(host: str) -> str:
+    """Bracket IPv6 literals so the host can be followed by a port."""
+    return f"[{host}]" if ":" in host else host
+
+
+def _url_userinfo(user: Optional[str], password: Optional[str]) -> str:
+    """Percent-encode credentials into a ``user:password@`` URL prefix."""
+    if user is None and password is None:
+        return ""
+    userinfo = quote(user or "", safe="")
+    if password is not None:
+        userinfo += f":{quote(password, safe='')}"
+    return f"{userinfo}@"
+
+
+@lru_cache(maxsize=4)
+def _build_db_url(
+    host: str,
+    port: int,
+    user: str,
+    password: str,
+    db_name: str,
+) -> str:
+    """Build and memoize a database URL for the given components."""
+    return (
+        f"postgresql+asyncpg://{_url_userinfo(user, password)}"
+        f"{_url_host(host)}:{port}/{db_name}"
+    )
+
+
 class LogLevel(str, enum.Enum):
     """Possible log levels."""
 
@@ -26,6 +57,10 @@ class Settings(BaseSettings):
 
     These parameters can be configured
     with environment variables.
+
+    Settings are frozen so derived URLs can be cached safely. For
+    overrides, build a new ``Settings(**values)``: ``model_copy`` would
+    carry over derived URLs already cached on the original.
     """
 
     host: str = "127.0.0.1"
@@ -57,6 +92,12 @@ class Settings(BaseSettings):
     db_user: str = "app"
     db_pass: str = "app"
     db_echo: bool = False
+    # Connection pool tuning, see ``DatabaseFactory``
+    db_pool_pre_ping: bool = False
+    db_pool_recycle: int = 1800
+    db_pgbouncer: bool = False
+    db_null_pool: bool = False
+    db_jit: bool = True
 
     # Variables for Redis
     redis_host: str = "app-redis"
@@ -69,95 +110,92 @@ class Settings(BaseSettings):
     celery_broker_url: Optional[str] = None
     celery_backend_url: Optional[str] = None
 
-
-    def db_url(self, db_name: str = "admin") -> URL:
+    def db_url(self, db_name: str = "admin") -> str:
         """
         Assemble database URL from settings.
 
         :param db_name: Database name.
         :return: database URL.
         """
-        return URL.build(
-            scheme="postgresql+asyncpg",
-            host=self.db_host,
-            port=self.db_port,
-            user=self.db_user,
-            password=self.db_pass,
-            path=f"/{db_name}",
+        return _build_db_url(
+            self.db_host,
+            self.db_port,
+            self.db_user,
+            self.db_pass,
+            db_name,
         )
 
-    @property
-    def redis_url(self) -> URL:
+    @cached_property
+    def redis_url(self) -> str:
         """
         Assemble REDIS URL from settings.
 
         :return: redis URL.
         """
+        auth = _url_userinfo(self.redis_user, self.redis_pass)
         path = ""
         if self.redis_base is not None:
             path = f"/{self.redis_base}"
-        return URL.build(
-            scheme="redis",
-            host=self.redis_host,
-            port=self.redis_port,
-            user=self.redis_user,
-            password=self.redis_pass,
-            path=path,
-        )
+        return f"redis://{auth}{_url_host(self.redis_host)}:{self.redis_port}{path}"
+
+    def _redis_celery_url(self, default_base: int) -> str:
+        """
+        Assemble a Redis URL for Celery, with authentication if configured.
+
+        :param default_base: Redis database used when redis_base is unset.
+        :return: Redis URL.
+        """
+        auth = ""
+        if self.redis_pass:
+            auth = _url_userinfo(self.redis_user, self.redis_pass)
+        base = self.redis_base if self.redis_base is not None else default_base
+        return f"redis://{auth}{_url_host(self.redis_host)}:{self.redis_port}/{base}"
 
-    @property
+    @cached_property
     def celery_broker_url_computed(self) -> str:
-        """Assemble Celery broker URL from settings.
+        """Celery broker URL.
 
-        Uses explicit celery_broker_url if set, otherwise defaults to Redis.
+        Uses explicit celery_broker_url if set, otherwise defaults to Redis
+        database 0.
 
         :return: Celery broker URL.
         """
-        if self.celery_broker_url:
-            return self.celery_broker_url
-        # Use Redis with authentication
-        # Build URL with password if provided
-        if self.redis_pass:
-            auth = (
-                f":{self.redis_pass}@"
-                if self.redis_user is None
-                else f"{self.redis_user}:{self.redis_pass}@"
-            )
-            base = self.redis_base if self.redis_base is not None else 0
-            return f"redis://{auth}{self.redis_host}:{self.redis_port}/{base}"
-        # Fallback to no auth
-        base = self.redis_base if self.redis_base is not None else 0
-        return f"redis://{self.redis_host}:{self.redis_port}/{base}"
-
-    @property
+        return self.celery_broker_url or self._redis_celery_url(0)
+
+    @cached_property
     def celery_backend_url_computed(self) -> str:
-        """Assemble Celery result backend URL from settings.
+        """Celery result backend URL.
 
-        Uses explicit celery_backend_url if set, otherwise defaults to Redis.
+        Uses explicit celery_backend_url if set, otherwise defaults to Redis
+        database 1.
 
         :return: Celery backend URL.
         """
-        if self.celery_backend_url:
-            return self.celery_backend_url
-        # Use Redis with authentication for backend (can be same or different DB)
-        # Build URL with password if provided
-        if self.redis_pass:
-            auth = (
-                f":{self.redis_pass}@"
-                if self.redis_user is None
-                else f"{self.redis_user}:{self.redis_pass}@"
-            )
-            base = self.redis_base if self.redis_base is not None else 1
-            return f"redis://{auth}{self.redis_host}:{self.redis_port}/{base}"
-        # Fallback to no auth
-        base = self.redis_base if self.redis_base is not None else 1
-        return f"redis://{self.redis_host}:{self.redis_port}/{base}"
+        return self.celery_backend_url or self._redis_celery_url(1)
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_prefix="APP_",
         env_file_encoding="utf-8",
+        frozen=True,
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings.
+
+    Settings are parsed from the environment on first call and the same
+    instance is returned afterwards.
+
+    :return: application settings.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Keep ``from app.settings import settings`` working lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,53 @@
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, UJSONResponse
 
 from app.core.constants import ResponseParams
-from app.settings import settings
+from app.settings import get_settings
 
-API_VERSION = settings.api_version
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Response keys resolved once instead of on every response.
+_KEY_API_VERSION = ResponseParams.API_VERSION
+_KEY_TIMESTAMP = ResponseParams.TIMESTAMP
+_KEY_REQUEST_ID = ResponseParams.REQUEST_ID
+_KEY_TOTAL_RECORDS = ResponseParams.TOTAL_RECORDS
+_KEY_PAGE = ResponseParams.PAGE
+_KEY_PER_PAGE = ResponseParams.PER_PAGE
+_KEY_TOTAL_PAGES = ResponseParams.TOTAL_PAGES
+_KEY_SUCCESS = ResponseParams.SUCCESS
+_KEY_MESSAGE = ResponseParams.MESSAGE
+_KEY_DATA = ResponseParams.DATA
+_KEY_META = ResponseParams.META
+_KEY_ERROR = ResponseParams.ERROR
+
+# Shared by every success response; only ever serialized, never mutated.
+_EMPTY_ERROR: Dict[str, Any] = {}
+
+# (epoch second, formatted second) of the last timestamp built; replaced as
+# a whole tuple so readers never see a mismatched pair.
+_timestamp_cache: List[Tuple[int, str]] = [(-1, "")]
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with millisecond precision and a ``Z``.
+
+    The date/time part is formatted at most once per second.
+
+    Returns:
+        Timestamp string, e.g. ``2024-01-01T12:00:00.123Z``.
+    """
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_cache[0]
+    if seconds != cached_seconds:
+        prefix = datetime.fromtimestamp(seconds, timezone.utc).strftime(
+            TIMESTAMP_FORMAT,
+        )
+        _timestamp_cache[0] = (seconds, prefix)
+    return f"{prefix}.{nanos // 1_000_000:03d}Z"
 
 
 def build_meta(
@@ -36,22 +76,16 @@ def build_meta(
         total_records = len(data) if isinstance(data, list) else 1
 
     meta: Dict[str, Any] = {
-        ResponseParams.API_VERSION: API_VERSION,
-        ResponseParams.TIMESTAMP: datetime.now(timezone.utc)
-        .isoformat()
-        .replace("+00:00", "Z"),
-        ResponseParams.REQUEST_ID: request.headers.get("x-request-id"),
-        ResponseParams.TOTAL_RECORDS: total_records,
+        _KEY_API_VERSION: get_settings().api_version,
+        _KEY_TIMESTAMP: utc_timestamp(),
+        _KEY_REQUEST_ID: request.headers.get("x-request-id"),
+        _KEY_TOTAL_RECORDS: total_records,
     }
 
     if page is not None and limit is not None:
-        meta.update(
-            {
-                ResponseParams.PAGE: page,
-                ResponseParams.PER_PAGE: limit,
-                ResponseParams.TOTAL_PAGES: pages or 1,
-            },
-        )
+        meta[_KEY_PAGE] = page
+        meta[_KEY_PER_PAGE] = limit
+        meta[_KEY_TOTAL_PAGES] = pages or 1
 
     return meta
 
@@ -77,13 +111,13 @@ def standard_response(
         total_records: Explicit total record count (optional).
 
     Returns:
-        JSONResponse with standardized structure.
+        UJSONResponse with standardized structure.
     """
     response_body: Dict[str, Any] = {
-        ResponseParams.SUCCESS: True,
-        ResponseParams.MESSAGE: message,
-        ResponseParams.DATA: data,
-        ResponseParams.META: build_meta(
+        _KEY_SUCCESS: True,
+        _KEY_MESSAGE: message,
+        _KEY_DATA: data,
+        _KEY_META: build_meta(
             request=request,
             data=data,
             page=page,
@@ -91,7 +125,7 @@ def standard_response(
             pages=pages,
             total_records=total_records,
         ),
-        ResponseParams.ERROR: {},
+        _KEY_ERROR: _EMPTY_ERROR,
     }
 
-    return JSONResponse(content=response_body, status_code=200)
+    return UJSONResponse(content=response_body, status_code=200)
@@ -44,12 +44,11 @@ def validate_common_headers(
     if not x_platform or not x_version or not x_appname:
         raise MissingHeadersError(detail=ErrorMessages.MISSING_HEADERS_DETAILS)
 
-    return CommonHeaders.model_validate(
-        {
-            "x-platform": x_platform,
-            "x-version": x_version,
-            "x-appname": x_appname,
-            "x-request-id": x_request_id.strip() if x_request_id else None,
-            "x-user-id": x_user_id.strip() if x_user_id else None,
-        },
+    # Values are already str from ``Header(...)``; skip pydantic validation.
+    return CommonHeaders.model_construct(
+        platform=x_platform,
+        version=x_version,
+        appname=x_appname,
+        request_id=x_request_id.strip() if x_request_id else None,
+        user_id=x_user_id.strip() if x_user_id else None,
     )
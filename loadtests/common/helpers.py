@@ -1,7 +1,10 @@
 # This file contains helper functions for the load tests.
 import random
 
+# Every possible request ID, formatted once at import instead of per task.
+_REQUEST_IDS = tuple(f"locust-{n}" for n in range(1000, 10000))
+
 
 def get_random_request_id_header():
     """Generates a header with a random request ID."""
-    return {"x-request-id": f"locust-{random.randint(1000, 9999)}"}
+    return {"x-request-id": random.choice(_REQUEST_IDS)}
@@ -6,6 +6,7 @@ import asyncio
 from pathlib import Path
 import meilisearch
 from app.core.search.config import load_index_configs
+from app.db.factory import DatabaseFactory
 from app.settings import settings
 from scripts.utils import check_config, get_tasks, process_tasks
 
@@ -25,7 +26,10 @@ async def main():
 
     tasks = get_tasks()
 
-    await process_tasks(tasks, config, client)
+    try:
+        await process_tasks(tasks, config, client)
+    finally:
+        await DatabaseFactory.dispose_all()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import re
 from datetime import datetime
+from functools import lru_cache
 from loguru import logger
 from sqlalchemy import text
 from app.core.constants import AppConfig, MeiliSearchIndexes
@@ -88,13 +89,30 @@ def get_sortable_attributes(ranking_rules):
     return list(sortable)
 
 
+@lru_cache(maxsize=None)
+def get_db_factory(db_base):
+    """Returns the database factory shared by all queries on db_base."""
+    return DatabaseFactory(
+        db_url=settings.db_url(db_base),
+        db_echo=settings.db_echo,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+        pgbouncer=settings.db_pgbouncer,
+        null_pool=settings.db_null_pool,
+        jit=settings.db_jit,
+    )
+
+
 async def fetch_data(query_str, db_base):
-    """Fetch data from database using the provided SQL query."""
+    """Fetch data from database using the provided SQL query.
+
+    The engine is shared across calls for the same database within one event
+    loop; callers dispose it from that loop with
+    ``DatabaseFactory.dispose_all()`` when done.
+    """
     logger.debug(f"Executing query: {query_str.strip().splitlines()[0]}...")
 
-    db_factory = DatabaseFactory(
-        db_url=str(settings.db_url(db_base)), db_echo=settings.db_echo
-    )
+    db_factory = get_db_factory(db_base)
 
     data = []
     try:
@@ -114,8 +132,6 @@ async def fetch_data(query_str, db_base):
 
     except Exception as e:
         logger.error(f"Error fetching data: {e}")
-    finally:
-        await db_factory.close()
 
     return data
 
@@ -0,0 +1,95 @@
+import importlib
+import json
+import sys
+from types import ModuleType
+from typing import Any, Dict, Tuple
+
+import pytest
+from starlette import status
+
+import app.core.exceptions
+
+
+class _ConstantNames:
+    """Stand-in for constant classes: every attribute is its own name."""
+
+    def __getattr__(self, name: str) -> str:
+        return name
+
+
+@pytest.fixture
+def exceptions_module(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Import a fresh exceptions module against stubbed constants."""
+    constants = ModuleType("app.core.constants")
+    constants.ErrorCodes = _ConstantNames()  # type: ignore[attr-defined]
+    constants.ErrorMessages = _ConstantNames()  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "app.core.constants", constants)
+    monkeypatch.delitem(sys.modules, "app.core.exceptions.exceptions", raising=False)
+    monkeypatch.setattr(app.core.exceptions, "exceptions", None, raising=False)
+    return importlib.import_module("app.core.exceptions.exceptions")
+
+
+@pytest.fixture
+def error_responses(exceptions_module: Any) -> Dict[Any, Tuple[int, bytes]]:
+    """Pre-rendered error bodies of the fresh exceptions module."""
+    return exceptions_module._ERROR_RESPONSES  # noqa: SLF001
+
+
+def test_cached_body_matches_rendered(
+    exceptions_module: Any,
+    error_responses: Dict[Any, Tuple[int, bytes]],
+) -> None:
+    """The pre-rendered body of a no-detail error equals a fresh render."""
+    error_cls = exceptions_module.DBIntegrityError
+    exceptions_module.build_error_responses()
+    assert error_cls in error_responses
+
+    cached = error_cls().to_response()
+    error_responses.clear()
+    rendered = error_cls().to_response()
+
+    assert cached.status_code == rendered.status_code == status.HTTP_409_CONFLICT
+    assert cached.body == rendered.body
+
+
+def test_custom_detail_skips_cache(
+    exceptions_module: Any,
+    error_responses: Dict[Any, Tuple[int, bytes]],
+) -> None:
+    """An error raised with a custom detail is rendered, not cached."""
+    error_cls = exceptions_module.DBIntegrityError
+    exceptions_module.build_error_responses()
+    error_responses[error_cls] = (
+        status.HTTP_409_CONFLICT,
+        b"cached",
+    )
+
+    response = error_cls("duplicate key").to_response()
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert json.loads(response.body)["error"]["message"] == "duplicate key"
+
+
+def test_late_subclass_is_rendered(
+    exceptions_module: Any,
+    error_responses: Dict[Any, Tuple[int, bytes]],
+) -> None:
+    """A subclass defined after pre-rendering falls back to rendering."""
+    exceptions_module.build_error_responses()
+
+    class LateError(exceptions_module.AppError):
+        http_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        message = "late"
+        error_code = "LATE_ERROR_CODE"
+
+    assert LateError not in error_responses
+
+    response = LateError().to_response()
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert json.loads(response.body)["error"] == {
+        "code": status.HTTP_503_SERVICE_UNAVAILABLE,
+        "error_code": "LATE_ERROR_CODE",
+        "message": "late",
+        "type": "LateError",
+    }